@@ -2,14 +2,91 @@ import argparse
 import os
 import sys
 import logging
+import codecs
+import contextlib
 import datetime
-import pytz
+import functools
+import mmap
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from PIL import Image, ExifTags
+import piexif
 import chardet
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# File extensions handled by each processor (crude check, extend for more file types)
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".tiff", ".tif")
+TEXT_EXTENSIONS = (".txt", ".log", ".csv", ".json", ".xml")
+
+# Zone names outside Etc/ that are aliases of a fixed UTC offset
+_FIXED_OFFSET_ZONE_NAMES = frozenset(("UTC", "UCT", "GMT", "GMT0", "GMT+0", "GMT-0", "Greenwich", "Universal", "Zulu"))
+
+# EXIF tags holding the timestamps to normalize
+_DATETIME_TAG_IDS = frozenset((piexif.ImageIFD.DateTime, piexif.ExifIFD.DateTimeOriginal, piexif.ExifIFD.DateTimeDigitized))
+
+# Matches candidate timestamps in text content. Every layout the text scanner accepts is
+# combined into a single alternation so the content is scanned once regardless of how
+# many formats are recognized, and each of them is also accepted by _TIMESTAMP_PARSERS.
+# The time component is mandatory: the parsers have no date-only layout. All matches
+# are fixed-width and year-first, so a normalized value can be written back in the
+# layout it was found in. "NN/NN/YYYY" is left out on purpose: whether it is month- or
+# day-first cannot be told from the text, and neither are timestamps that carry their
+# own UTC offset or "Z" suffix, which must not be reinterpreted as the assumed source
+# zone. All quantifiers are fixed-width, so a failed match never backtracks.
+TIMESTAMP_RE = re.compile(
+    r'\b\d{4}(?:-\d{2}-\d{2}[ T]|:\d{2}:\d{2} |/\d{2}/\d{2} )\d{2}:\d{2}:\d{2}\b'  # YYYY-MM-DD[ T]HH:MM:SS, YYYY:MM:DD HH:MM:SS, YYYY/MM/DD HH:MM:SS
+    r'(?!(?:[.,]\d+)?(?:[Zz]|[+-]\d{2}))',
+    re.ASCII,
+)
+
+# The same pattern for scanning raw bytes. Timestamps are pure ASCII, so in any
+# ASCII-compatible encoding they can be matched without decoding the file.
+TIMESTAMP_BYTES_RE = re.compile(TIMESTAMP_RE.pattern.encode('ascii'))
+
+# Anchored parsers for every accepted timestamp layout. Named groups let a match be
+# turned straight into a datetime without going through strptime. They follow
+# strptime's field rules: ASCII digits only, and a day may be space-padded (" 2") while
+# a month may not. The separator before the time is any whitespace, as with strptime.
+# The layouts are mutually exclusive, so the list is kept in most-recently-used order:
+# inputs tend to share one layout, which then matches on the first attempt.
+_DAY_PATTERN = r'\d{1,2}| [1-9]'
+_CLOCK_PATTERN = r'(?P<H>\d{1,2}):(?P<M>\d{1,2}):(?P<S>\d{1,2})'
+_TIME_PATTERN = r'(?u:\s+)' + _CLOCK_PATTERN
+# "NN/NN/YYYY" is read month-first, falling back to day-first if that is not a valid
+# date. Either field may be the day, so both allow space padding.
+_SLASH_YEAR_LAST_PARSER = re.compile(r'(?P<m>' + _DAY_PATTERN + r')/(?P<d>' + _DAY_PATTERN + r')/(?P<Y>\d{4})' + _TIME_PATTERN, re.ASCII)  # %m/%d/%Y or %d/%m/%Y %H:%M:%S
+_TIMESTAMP_PARSERS = [
+    re.compile(r'(?P<Y>\d{4}):(?P<m>\d{1,2}):(?P<d>' + _DAY_PATTERN + ')' + _TIME_PATTERN, re.ASCII),      # %Y:%m:%d %H:%M:%S
+    re.compile(r'(?P<Y>\d{4})-(?P<m>\d{1,2})-(?P<d>' + _DAY_PATTERN + ')' + _TIME_PATTERN, re.ASCII),      # %Y-%m-%d %H:%M:%S
+    re.compile(r'(?P<Y>\d{4})-(?P<m>\d{1,2})-(?P<d>' + _DAY_PATTERN + ')[Tt]' + _CLOCK_PATTERN, re.ASCII), # %Y-%m-%dT%H:%M:%S
+    re.compile(r'(?P<Y>\d{4})/(?P<m>\d{1,2})/(?P<d>' + _DAY_PATTERN + ')' + _TIME_PATTERN, re.ASCII),      # %Y/%m/%d %H:%M:%S
+    _SLASH_YEAR_LAST_PARSER,
+]
+
+def _positive_int(value):
+    """
+    Parses a command-line value as an integer of at least 1.
+
+    Args:
+        value (str): The raw argument value.
+
+    Returns:
+        int: The parsed value.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def setup_argparse():
     """
     Sets up the argument parser for the command-line interface.
@@ -18,57 +95,286 @@ def setup_argparse():
         argparse.ArgumentParser: The argument parser object.
     """
     parser = argparse.ArgumentParser(description="Normalize timestamps in file metadata to UTC.")
-    parser.add_argument("file_path", help="Path to the file to process.")
+    parser.add_argument("file_path", nargs="+", help="Path(s) to the file(s) to process.")
+    parser.add_argument("--recursive", action="store_true", help="Process supported files in the given directories recursively.")
+    parser.add_argument("--jobs", type=_positive_int, default=None, help="Number of worker processes when processing several files (default: number of CPUs).")
     parser.add_argument("--timezone", default="UTC", help="Timezone to normalize to (default: UTC).")
     parser.add_argument("--dry-run", action="store_true", help="Perform a dry run without modifying the file.")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging.")
     return parser
 
-def normalize_timestamp(timestamp, source_timezone, target_timezone="UTC"):
+@functools.lru_cache(maxsize=None)
+def _get_tz(name):
     """
-    Normalizes a timestamp string from a source timezone to a target timezone.
+    Resolves a timezone name to a tzinfo object, caching the result.
 
     Args:
-        timestamp (str): The timestamp string to normalize.
-        source_timezone (str): The timezone of the input timestamp.
-        target_timezone (str): The timezone to convert to (default: UTC).
+        name (str): The timezone name (e.g. "UTC", "Europe/Berlin").
 
     Returns:
-        str: The normalized timestamp string, or None if an error occurred.
+        zoneinfo.ZoneInfo: The timezone object.
+    """
+    return ZoneInfo(name)
+
+def _is_fixed_offset(tz):
+    """
+    Checks whether a timezone has a single UTC offset with no DST or historical changes.
+
+    Args:
+        tz (zoneinfo.ZoneInfo): The timezone object.
+
+    Returns:
+        bool: True for UTC/GMT aliases and the Etc/ zones.
+    """
+    return tz.key in _FIXED_OFFSET_ZONE_NAMES or tz.key.startswith("Etc/")
+
+@functools.lru_cache(maxsize=None)
+def _get_conversion(source_timezone, target_timezone):
+    """
+    Resolves a source/target timezone pair, caching the result. When both zones have a
+    fixed UTC offset, the conversion collapses to adding a constant delta.
+
+    Args:
+        source_timezone (str): The timezone of the input timestamps.
+        target_timezone (str): The timezone to convert to.
+
+    Returns:
+        tuple: The source and target timezone objects, and the datetime.timedelta to add
+               for fixed-offset pairs (None if a full timezone conversion is needed).
+    """
+    source_tz, target_tz = _get_tz(source_timezone), _get_tz(target_timezone)
+    if source_tz is target_tz:
+        delta = datetime.timedelta(0)
+    elif _is_fixed_offset(source_tz) and _is_fixed_offset(target_tz):
+        # Any instant gives the offset of a fixed-offset zone
+        reference = datetime.datetime(2000, 1, 1)
+        delta = target_tz.utcoffset(reference) - source_tz.utcoffset(reference)
+    else:
+        delta = None
+    return source_tz, target_tz, delta
+
+def _resolve_conversion(source_timezone, target_timezone):
+    """
+    Resolves the conversion between the source and target timezones.
+
+    Args:
+        source_timezone (str): The timezone of the input timestamps.
+        target_timezone (str): The timezone to convert to.
+
+    Returns:
+        tuple: The conversion as returned by _get_conversion, or None if either timezone could not be resolved.
     """
     try:
-        # Attempt to parse the timestamp using a flexible format
+        return _get_conversion(source_timezone, target_timezone)
+    except ZoneInfoNotFoundError as e:
+        logging.error(f"Invalid timezone: {e}")
+        return None
+    except Exception as e:
+        logging.error(f"Error resolving timezone: {e}")
+        return None
+
+def _parse_timestamp(timestamp):
+    """
+    Parses a timestamp string in any of the accepted layouts.
+
+    Args:
+        timestamp (str): The timestamp string to parse.
+
+    Returns:
+        datetime.datetime: The parsed (naive) datetime, or None if no layout matched.
+    """
+    # Every accepted layout starts with a digit, or a space-padded day followed by one.
+    # Rejecting anything else up front keeps placeholders such as blank EXIF dates
+    # ("    :  :     :  :  ") away from the parsers.
+    if not isinstance(timestamp, str):
+        return None
+    first_digit = timestamp[1:2] if timestamp.startswith(' ') else timestamp[:1]
+    if not first_digit.isdigit():
+        return None
+
+    # Fast path for the fixed-width EXIF layout "YYYY:MM:DD HH:MM:SS", which covers
+    # nearly every value read from images: slice the fields at known offsets.
+    if (len(timestamp) == 19 and timestamp.isascii() and timestamp[4] == ':' and timestamp[7] == ':' and timestamp[10] == ' '
+            and timestamp[13] == ':' and timestamp[16] == ':'):
+        fields = (timestamp[0:4], timestamp[5:7], timestamp[8:10], timestamp[11:13], timestamp[14:16], timestamp[17:19])
+        # int() would also accept padding spaces and signs, which the fast path leaves to the generic parsers
+        if all(field.isdigit() for field in fields):
+            try:
+                return datetime.datetime(*map(int, fields))
+            except ValueError:
+                pass # Out of range; let the generic parsers decide
+
+    for parser in _TIMESTAMP_PARSERS:
+        match = parser.fullmatch(timestamp)
+        if match is None:
+            continue
+
+        year = int(match['Y'])
+        clock = int(match['H']), int(match['M']), int(match['S'])
+        candidates = [(match['m'], match['d'])]
+        if parser is _SLASH_YEAR_LAST_PARSER:
+            candidates.append((match['d'], match['m']))
+
         dt_object = None
-        formats_to_try = ["%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S"]
-        for fmt in formats_to_try:
+        for month, day in candidates:
+            if month.startswith(' '):
+                continue # Only days may be space-padded
             try:
-                dt_object = datetime.datetime.strptime(timestamp, fmt)
-                break  # If parsing succeeds, exit the loop
+                dt_object = datetime.datetime(year, int(month), int(day), *clock)
+                break
             except ValueError:
-                continue # Try the next format
+                continue # Fields out of range, e.g. month 13
         if dt_object is None:
-          logging.error(f"Could not parse timestamp: {timestamp} with any known format. Please check your input format")
-          return None
+            return None
+
+        # Promote the layout that matched so the next timestamp tries it first.
+        if _TIMESTAMP_PARSERS[0] is not parser:
+            _TIMESTAMP_PARSERS.remove(parser)
+            _TIMESTAMP_PARSERS.insert(0, parser)
+        return dt_object
+    return None
+
+def _format_timestamp(dt_object, template=None):
+    """
+    Formats a datetime in the EXIF layout "YYYY:MM:DD HH:MM:SS". Plain integer
+    formatting avoids strftime's per-call format parsing and always zero-pads the year.
+
+    Args:
+        dt_object (datetime.datetime): The datetime to format.
+        template (str): A fixed-width, year-first timestamp as matched by TIMESTAMP_RE
+                        whose date separator and date/time separator are reused instead
+                        of the EXIF ones (default: None).
+
+    Returns:
+        str: The formatted timestamp string.
+    """
+    date_separator, time_separator = (':', ' ') if template is None else (template[4], template[10])
+    return "%04d%s%02d%s%02d%s%02d:%02d:%02d" % (dt_object.year, date_separator, dt_object.month, date_separator,
+                                                 dt_object.day, time_separator, dt_object.hour, dt_object.minute,
+                                                 dt_object.second)
 
+def _convert_timestamp(timestamp, source_tz, target_tz, delta, keep_layout=False):
+    """
+    Parses a timestamp string and converts it between two resolved timezones.
 
-        # Localize the datetime object to the source timezone
-        source_tz = pytz.timezone(source_timezone)
-        localized_dt = source_tz.localize(dt_object)
+    Args:
+        timestamp (str): The timestamp string to normalize.
+        source_tz (datetime.tzinfo): The timezone of the input timestamp.
+        target_tz (datetime.tzinfo): The timezone to convert to.
+        delta (datetime.timedelta): The constant offset between fixed-offset zones, or None.
+        keep_layout (bool): Format the result in the layout of the input (see normalize_timestamps).
 
-        # Convert to the target timezone
-        target_tz = pytz.timezone(target_timezone)
-        utc_dt = localized_dt.astimezone(target_tz)
+    Returns:
+        str: The normalized timestamp string, or None if an error occurred.
+    """
+    try:
+        dt_object = _parse_timestamp(timestamp)
+        if dt_object is None:
+          logging.error("Could not parse timestamp: %s with any known format. Please check your input format", timestamp)
+          return None
+
+        # Localize to the source timezone and convert to the target timezone. Between
+        # fixed-offset zones (including a zone and itself) this is a constant shift.
+        if delta is None:
+            dt_object = dt_object.replace(tzinfo=source_tz).astimezone(target_tz)
+        elif delta:
+            dt_object += delta
 
         # Format the output timestamp string
-        return utc_dt.strftime("%Y:%m:%d %H:%M:%S")
+        return _format_timestamp(dt_object, timestamp if keep_layout else None)
 
-    except pytz.exceptions.UnknownTimeZoneError as e:
-        logging.error(f"Invalid timezone: {e}")
-        return None
     except Exception as e:
-        logging.error(f"Error normalizing timestamp: {e}")
+        logging.error("Error normalizing timestamp: %s", e)
         return None
 
+def normalize_timestamp(timestamp, source_timezone, target_timezone="UTC"):
+    """
+    Normalizes a timestamp string from a source timezone to a target timezone.
+
+    Args:
+        timestamp (str): The timestamp string to normalize.
+        source_timezone (str): The timezone of the input timestamp.
+        target_timezone (str): The timezone to convert to (default: UTC).
+
+    Returns:
+        str: The normalized timestamp string, or None if an error occurred.
+    """
+    conversion = _resolve_conversion(source_timezone, target_timezone)
+    if conversion is None:
+        return None
+    return _convert_timestamp(timestamp, *conversion)
+
+def normalize_timestamps(timestamps, source_timezone, target_timezone="UTC", keep_layout=False):
+    """
+    Normalizes a batch of timestamp strings from a source timezone to a target timezone.
+    The timezones are resolved once for the whole batch.
+
+    Args:
+        timestamps (iterable of str): The timestamp strings to normalize.
+        source_timezone (str): The timezone of the input timestamps.
+        target_timezone (str): The timezone to convert to (default: UTC).
+        keep_layout (bool): Format each result in the layout of its input instead of the
+                            EXIF layout. Only valid for timestamps as matched by
+                            TIMESTAMP_RE (default: False).
+
+    Returns:
+        dict: Maps each successfully normalized timestamp to its normalized string.
+              Timestamps that could not be normalized are omitted.
+    """
+    conversion = _resolve_conversion(source_timezone, target_timezone)
+    if conversion is None:
+        return {}
+
+    normalized = {}
+    for timestamp in timestamps:
+        normalized_timestamp = _convert_timestamp(timestamp, *conversion, keep_layout)
+        if normalized_timestamp:
+            normalized[timestamp] = normalized_timestamp
+    return normalized
+
+def _load_exif(file_path):
+    """
+    Loads the EXIF data of an image as a piexif dictionary. JPEG and TIFF files are read
+    by piexif directly without decoding any image data; other formats (e.g. PNG) fall
+    back to Pillow to extract the raw EXIF block.
+
+    Args:
+        file_path (str): The path to the image file.
+
+    Returns:
+        dict: The piexif EXIF dictionary, or None if the image has no EXIF data.
+    """
+    try:
+        exif_dict = piexif.load(file_path)
+    except piexif.InvalidImageDataError:
+        with Image.open(file_path) as img:
+            exif_bytes = img.info.get("exif")
+        if not exif_bytes:
+            return None
+        exif_dict = piexif.load(exif_bytes)
+
+    if not any(exif_dict.get(ifd) for ifd in ("0th", "Exif", "GPS", "Interop", "1st")):
+        return None
+    return exif_dict
+
+def _write_exif(file_path, exif_dict):
+    """
+    Writes a piexif EXIF dictionary back to an image. For JPEG files only the EXIF
+    segment is replaced and the compressed image data is copied unchanged; other
+    formats are re-saved through Pillow.
+
+    Args:
+        file_path (str): The path to the image file.
+        exif_dict (dict): The piexif EXIF dictionary to write.
+    """
+    exif_bytes = piexif.dump(exif_dict)
+    if os.path.splitext(file_path)[1].lower() in (".jpg", ".jpeg"):
+        piexif.insert(exif_bytes, file_path)
+    else:
+        with Image.open(file_path) as img:
+            img.load()
+            img.save(file_path, exif=exif_bytes)
+
 def process_image_file(file_path, target_timezone, dry_run, verbose):
     """
     Processes an image file to normalize timestamps in its EXIF data.
@@ -80,40 +386,42 @@ def process_image_file(file_path, target_timezone, dry_run, verbose):
         verbose (bool): Whether to enable verbose logging.
     """
     try:
-        img = Image.open(file_path)
-        exif_data = img._getexif()
+        exif_dict = _load_exif(file_path)
 
-        if exif_data is None:
+        if exif_dict is None:
             logging.warning(f"No EXIF data found in {file_path}")
             return
 
-        updated_exif = {}
-        for tag_id, value in exif_data.items():
-            tag = ExifTags.TAGS.get(tag_id, tag_id)
-            if verbose:
-                logging.info(f"Processing tag: {tag} with value: {value}")
-
-            # Normalize DateTime, DateTimeOriginal, DateTimeDigitized
-            if tag in ("DateTime", "DateTimeOriginal", "DateTimeDigitized"):
-                normalized_timestamp = normalize_timestamp(value, "UTC", target_timezone) #Assume UTC as source in EXIF if not specified
-                if normalized_timestamp:
-                    updated_exif[tag_id] = normalized_timestamp
-                    logging.info(f"Normalized {tag} from {value} to {normalized_timestamp} ({target_timezone})")
-                else:
-                    logging.warning(f"Failed to normalize {tag} with value: {value}")
-
-        if updated_exif:
+        changes = {}
+        normalized_values = {} # DateTime tags usually share one value; normalize each distinct value once
+        for ifd in ("0th", "Exif"):
+            for tag_id, value in exif_dict[ifd].items():
+                if verbose:
+                    logging.info("Processing tag: %s with value: %s", ExifTags.TAGS.get(tag_id, tag_id), value)
+
+                # Normalize DateTime, DateTimeOriginal, DateTimeDigitized
+                if tag_id in _DATETIME_TAG_IDS:
+                    tag = ExifTags.TAGS[tag_id]
+                    if isinstance(value, bytes):
+                        value = value.decode("ascii", "replace")
+                    if value not in normalized_values:
+                        normalized_values[value] = normalize_timestamp(value, "UTC", target_timezone) #Assume UTC as source in EXIF if not specified
+                    normalized_timestamp = normalized_values[value]
+                    if normalized_timestamp:
+                        logging.info("Normalized %s from %s to %s (%s)", tag, value, normalized_timestamp, target_timezone)
+                        if normalized_timestamp != value:
+                            exif_dict[ifd][tag_id] = normalized_timestamp.encode("ascii")
+                            changes[tag] = normalized_timestamp
+                    else:
+                        logging.warning("Failed to normalize %s with value: %s", tag, value)
+
+        # Only write the file back if a value actually changed
+        if changes:
             if not dry_run:
-                # Update EXIF data
-                for tag_id, new_value in updated_exif.items():
-                    exif_data[tag_id] = new_value
-
-                # Construct the new EXIF data
-                new_exif = Image.ExifTags.ExifTag.string_to_bytes(Image.ExifTags.ExifTag.dict_to_bytes(exif_data))
-                img.save(file_path, exif=new_exif)
+                _write_exif(file_path, exif_dict)
                 logging.info(f"Successfully updated EXIF data in {file_path}")
             else:
-                logging.info(f"Dry run: EXIF data would be updated in {file_path} with the following changes: {updated_exif}")
+                logging.info(f"Dry run: EXIF data would be updated in {file_path} with the following changes: {changes}")
         else:
             logging.info(f"No DateTime related EXIF data found or updated in {file_path}")
 
@@ -125,6 +433,203 @@ def process_image_file(file_path, target_timezone, dry_run, verbose):
     except Exception as e:
         logging.error(f"An unexpected error occurred while processing {file_path}: {e}")
 
+def _is_ascii_compatible(encoding):
+    """
+    Checks whether an encoding stores every ASCII character as the same single byte and
+    never uses ASCII digit bytes inside multi-byte sequences.
+
+    Args:
+        encoding (str): The encoding name, as returned by detect_encoding.
+
+    Returns:
+        bool: True if timestamps can be matched on the raw bytes.
+    """
+    if not encoding:
+        return False
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+    return name in ("ascii", "utf-8", "utf-8-sig") or name.startswith(("iso8859-", "cp125"))
+
+def detect_encoding(file_path, chunk_size=65536):
+    """
+    Detects the encoding of a file by feeding it to chardet in fixed-size chunks,
+    stopping as soon as the detector is confident.
+
+    Args:
+        file_path (str): Path to the file.
+        chunk_size (int): Number of bytes read per chunk (default: 64 KiB).
+
+    Returns:
+        str: The detected encoding, or None if it could not be determined.
+    """
+    detector = chardet.UniversalDetector()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            detector.feed(chunk)
+            if detector.done:
+                break
+    detector.close()
+    return detector.result['encoding']
+
+@contextlib.contextmanager
+def _open_content(file_path, encoding):
+    """
+    Opens a text file for timestamp scanning. Files in an ASCII-compatible encoding are
+    memory-mapped and scanned as raw bytes; anything else is decoded into a string.
+
+    Args:
+        file_path (str): Path to the text file.
+        encoding (str): The file encoding, as returned by detect_encoding.
+
+    Yields:
+        tuple: The content (mmap.mmap or str) and the pattern to scan it with.
+    """
+    if _is_ascii_compatible(encoding) and os.path.getsize(file_path) > 0:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield content, TIMESTAMP_BYTES_RE
+    else:
+        with open(file_path, 'r', encoding=encoding) as f:
+            content = f.read()
+        yield content, TIMESTAMP_RE
+
+def _find_replacements(content, pattern, target_timezone):
+    """
+    Normalizes the distinct timestamps found in text content. Each result keeps the
+    layout of the timestamp it replaces, and timestamps that do not change are dropped.
+
+    Args:
+        content (str or mmap.mmap): The content to scan.
+        pattern (re.Pattern): TIMESTAMP_RE for decoded text, or TIMESTAMP_BYTES_RE for raw bytes.
+        target_timezone (str): Timezone to normalize to.
+
+    Returns:
+        dict: Maps each original timestamp string that changes to its normalized string.
+    """
+    # Collect the distinct strings that look like timestamps.
+    potential_timestamps = {match.group(0) for match in pattern.finditer(content)}
+    if isinstance(pattern.pattern, bytes):
+        # Only the matched slices are decoded, never the content itself.
+        potential_timestamps = {timestamp.decode('ascii') for timestamp in potential_timestamps}
+
+    normalized = normalize_timestamps(potential_timestamps, "UTC", target_timezone, keep_layout=True) #Assume UTC - MUST BE ADAPTED
+    replacements = {timestamp: normalized_timestamp for timestamp, normalized_timestamp in normalized.items()
+                    if normalized_timestamp != timestamp}
+    for timestamp, normalized_timestamp in replacements.items():
+        logging.info("Normalized timestamp %s to %s (%s)", timestamp, normalized_timestamp, target_timezone)
+    return replacements
+
+def _encode_replacements(pattern, replacements):
+    """
+    Converts the replacements to the type of content the pattern scans.
+
+    Args:
+        pattern (re.Pattern): TIMESTAMP_RE for decoded text, or TIMESTAMP_BYTES_RE for raw bytes.
+        replacements (dict): Maps original timestamp strings to normalized ones.
+
+    Returns:
+        dict: The replacements, ASCII-encoded if the pattern scans raw bytes.
+    """
+    if isinstance(pattern.pattern, bytes):
+        return {timestamp.encode('ascii'): normalized.encode('ascii') for timestamp, normalized in replacements.items()}
+    return replacements
+
+def _stream_normalized(f, content, pattern, replacements):
+    """
+    Writes the content with its timestamps replaced in a single pass over the matches,
+    streaming the spans between them so no rewritten copy is built in memory.
+
+    Args:
+        f (file object): The file to write to, opened in the mode matching the content.
+        content (str or mmap.mmap): The original content.
+        pattern (re.Pattern): The pattern the replacements were found with.
+        replacements (dict): Maps original to normalized timestamps, as returned by _encode_replacements.
+    """
+    last_end = 0
+    for match in pattern.finditer(content):
+        f.write(content[last_end:match.start()])
+        f.write(replacements.get(match.group(0), match.group(0)))
+        last_end = match.end()
+    f.write(content[last_end:])
+
+def _can_replace(real_path):
+    """
+    Checks whether a file can be swapped for a rewritten copy. That needs a writable
+    directory, and the file must have no other hard links, which would keep the old copy.
+    The file itself must be writable too: a read-only file must not be replaced behind
+    its permissions; the in-place rewrite then fails with a permission error instead.
+
+    Args:
+        real_path (str): The resolved path of the file.
+
+    Returns:
+        bool: True if the file can be replaced, False if it must be rewritten in place.
+    """
+    return (os.access(real_path, os.W_OK) and os.access(os.path.dirname(real_path), os.W_OK)
+            and os.stat(real_path).st_nlink == 1)
+
+def _write_normalized(real_path, content, pattern, replacements, encoding):
+    """
+    Writes the content with its timestamps replaced to a temporary file next to the
+    original. Permission bits and, where allowed, owner and group are copied from the
+    original; extended attributes and ACLs are not.
+
+    Args:
+        real_path (str): The resolved path of the original text file.
+        content (str or mmap.mmap): The original content.
+        pattern (re.Pattern): The pattern the replacements were found with.
+        replacements (dict): Maps original timestamp strings to normalized ones.
+        encoding (str): The encoding to write decoded text with.
+
+    Returns:
+        str: Path to the temporary file, ready to replace the original.
+    """
+    replacements = _encode_replacements(pattern, replacements)
+    mode, encoding = ('wb', None) if isinstance(pattern.pattern, bytes) else ('w', encoding)
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(real_path))
+    try:
+        with open(fd, mode, encoding=encoding) as f:
+            _stream_normalized(f, content, pattern, replacements)
+        shutil.copymode(real_path, temp_path)
+        if hasattr(os, 'chown'):
+            stat = os.stat(real_path)
+            try:
+                os.chown(temp_path, stat.st_uid, stat.st_gid)
+            except PermissionError:
+                pass # Only root may give a file away; keep the current owner
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return temp_path
+
+def _write_in_place(real_path, content, pattern, replacements, encoding):
+    """
+    Rewrites the timestamps directly in the original file, for files that cannot be
+    replaced (see _can_replace). Raw bytes are patched span by span, which is safe while
+    the file is mapped because every replacement is exactly as long as its match.
+    Decoded text is already in memory and is streamed back over the file.
+
+    Args:
+        real_path (str): The resolved path of the original text file.
+        content (str or mmap.mmap): The original content.
+        pattern (re.Pattern): The pattern the replacements were found with.
+        replacements (dict): Maps original timestamp strings to normalized ones.
+        encoding (str): The encoding to write decoded text with.
+    """
+    replacements = _encode_replacements(pattern, replacements)
+    if isinstance(pattern.pattern, bytes):
+        spans = [(match.start(), replacements[match.group(0)])
+                 for match in pattern.finditer(content) if match.group(0) in replacements]
+        with open(real_path, 'r+b') as f:
+            for start, normalized in spans:
+                f.seek(start)
+                f.write(normalized)
+    else:
+        with open(real_path, 'w', encoding=encoding) as f:
+            _stream_normalized(f, content, pattern, replacements)
+
 def process_text_file(file_path, target_timezone, dry_run, verbose):
     """
     Processes a text file, attempting to normalize timestamps found within its content.
@@ -138,41 +643,28 @@ def process_text_file(file_path, target_timezone, dry_run, verbose):
         verbose (bool): Enable verbose logging.
     """
     try:
-        # Detect file encoding
-        with open(file_path, 'rb') as f:
-            result = chardet.detect(f.read())
-        encoding = result['encoding']
-
-        with open(file_path, 'r', encoding=encoding) as f:
-            content = f.read()
-
-        #  Simple placeholder for timestamp detection.  Needs adaptation for real-world usage.
-        #  Ideally, regular expressions or format-specific parsing should be used.
-        #  This example just searches for strings that *look* like timestamps.
-        potential_timestamps = []
-        for line in content.splitlines():
-            words = line.split()
-            for word in words:
-                try:
-                    datetime.datetime.strptime(word, '%Y-%m-%d') # Check if it looks like a date
-                    potential_timestamps.append(word)
-                except ValueError:
-                    pass
-
-        normalized_content = content  # Start with the original content
-        replacements = {}
-
-        for timestamp in potential_timestamps:
-             normalized_timestamp = normalize_timestamp(timestamp, "UTC", target_timezone) #Assume UTC - MUST BE ADAPTED
-             if normalized_timestamp:
-                 replacements[timestamp] = normalized_timestamp
-                 normalized_content = normalized_content.replace(timestamp, normalized_timestamp)
-                 logging.info(f"Normalized timestamp {timestamp} to {normalized_timestamp} ({target_timezone})")
+        # Work on the link target so symlinks are written through rather than replaced.
+        real_path = os.path.realpath(file_path)
+        encoding = detect_encoding(real_path)
+
+        normalized_path = None
+        with _open_content(real_path, encoding) as (content, pattern):
+            replacements = _find_replacements(content, pattern, target_timezone)
+            if replacements and not dry_run:
+                if _can_replace(real_path):
+                    normalized_path = _write_normalized(real_path, content, pattern, replacements, encoding)
+                else:
+                    _write_in_place(real_path, content, pattern, replacements, encoding)
 
         if replacements:
             if not dry_run:
-                with open(file_path, 'w', encoding=encoding) as f:
-                    f.write(normalized_content)
+                if normalized_path is not None:
+                    # Swap in the rewritten copy only once the original is no longer mapped.
+                    try:
+                        os.replace(normalized_path, real_path)
+                    except BaseException:
+                        os.remove(normalized_path)
+                        raise
                 logging.info(f"Successfully normalized timestamps in {file_path}")
             else:
                 logging.info(f"Dry run: timestamps would be normalized in {file_path} with the following changes: {replacements}")
@@ -187,6 +679,79 @@ def process_text_file(file_path, target_timezone, dry_run, verbose):
     except Exception as e:
         logging.error(f"Error processing text file: {e}")
 
+def process_file(file_path, target_timezone, dry_run, verbose):
+    """
+    Dispatches a file to the image or text processor based on its extension.
+
+    Args:
+        file_path (str): Path to the file.
+        target_timezone (str): Timezone to normalize to.
+        dry_run (bool): Whether to perform a dry run.
+        verbose (bool): Enable verbose logging.
+    """
+    file_extension = os.path.splitext(file_path)[1].lower()
+    if file_extension in IMAGE_EXTENSIONS:
+        process_image_file(file_path, target_timezone, dry_run, verbose)
+    elif file_extension in TEXT_EXTENSIONS:
+        process_text_file(file_path, target_timezone, dry_run, verbose)
+    else:
+        logging.warning(f"Unsupported file type: {file_extension}. Only image and text files are currently supported.")
+
+def collect_files(paths, recursive):
+    """
+    Expands the command-line paths into the list of files to process.
+
+    Args:
+        paths (list of str): File paths, or directory paths when recursive is set.
+        recursive (bool): Whether to walk directories for supported files.
+
+    Returns:
+        list of str: The files to process, or None if a path is missing or unusable.
+    """
+    files = []
+    for path in paths:
+        if not os.path.exists(path):
+            logging.error(f"File not found: {path}")
+            return None
+        if not os.path.isdir(path):
+            files.append(path)
+        elif recursive:
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS + TEXT_EXTENSIONS:
+                        files.append(os.path.join(root, name))
+        else:
+            logging.error(f"{path} is a directory. Use --recursive to process directories.")
+            return None
+
+    # The same file can be reached through several paths (repeated arguments, symlinks,
+    # hard links). Every pass assumes a UTC source and shifts the timestamps again, so
+    # keep only the first path to each file.
+    unique_files = []
+    first_paths = {}
+    for file_path in files:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            unique_files.append(file_path) # e.g. a dangling symlink; the processor reports it
+            continue
+        key = (stat.st_dev, stat.st_ino)
+        if key in first_paths:
+            logging.info(f"Skipping {file_path}: same file as {first_paths[key]}")
+            continue
+        first_paths[key] = file_path
+        unique_files.append(file_path)
+    return unique_files
+
+def _init_worker(log_level):
+    """
+    Initializes a worker process, carrying over the parent's log level.
+
+    Args:
+        log_level (int): The root logger level to apply.
+    """
+    logging.getLogger().setLevel(log_level)
+
 def main():
     """
     Main function to execute the timestamp normalization process.
@@ -197,23 +762,26 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    file_path = args.file_path
     target_timezone = args.timezone
     dry_run = args.dry_run
 
-    if not os.path.exists(file_path):
-        logging.error(f"File not found: {file_path}")
+    file_paths = collect_files(args.file_path, args.recursive)
+    if file_paths is None:
         sys.exit(1)
+    if not file_paths:
+        logging.warning(f"No supported files found in: {', '.join(args.file_path)}")
+        return
 
     try:
-        # Determine file type (crude check, extend for more file types)
-        file_extension = os.path.splitext(file_path)[1].lower()
-        if file_extension in (".jpg", ".jpeg", ".png", ".tiff", ".tif"):
-            process_image_file(file_path, target_timezone, dry_run, args.verbose)
-        elif file_extension in (".txt", ".log", ".csv", ".json", ".xml"):
-            process_text_file(file_path, target_timezone, dry_run, args.verbose)
+        if len(file_paths) == 1 or args.jobs == 1:
+            for file_path in file_paths:
+                process_file(file_path, target_timezone, dry_run, args.verbose)
         else:
-            logging.warning(f"Unsupported file type: {file_extension}. Only image and text files are currently supported.")
+            # Files are independent and processing is CPU-bound, so spread them over processes.
+            with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                                     initargs=(logging.getLogger().level,)) as executor:
+                list(executor.map(process_file, file_paths, repeat(target_timezone),
+                                  repeat(dry_run), repeat(args.verbose)))
 
     except Exception as e:
         logging.error(f"An unexpected error occurred: {e}")
@@ -0,0 +1,25 @@
+import os
+
+import main
+
+def test_collect_files_keeps_first_path_to_each_file(tmp_path):
+    original = tmp_path / "x.log"
+    original.write_text("2023-01-02 03:04:05\n")
+    os.symlink(original, tmp_path / "y.log")
+    os.link(original, tmp_path / "z.log")
+    other = tmp_path / "other.log"
+    other.write_text("2023-01-02 03:04:05\n")
+
+    files = main.collect_files([str(original), str(tmp_path), str(original)], recursive=True)
+
+    assert files == [str(original), str(other)]
+
+def test_recursive_run_converts_symlinked_file_once(tmp_path, monkeypatch):
+    original = tmp_path / "x.log"
+    original.write_text("at 2023-01-02 03:04:05\n")
+    os.symlink(original, tmp_path / "y.log")
+
+    monkeypatch.setattr("sys.argv", ["main.py", str(tmp_path), "--recursive", "--jobs", "1", "--timezone", "Asia/Tokyo"])
+    main.main()
+
+    assert original.read_text() == "at 2023-01-02 12:04:05\n"
@@ -0,0 +1,59 @@
+import datetime
+
+import pytest
+
+import main
+
+# The strptime formats normalize_timestamp accepted before parsing moved to
+# precompiled regexes; _parse_timestamp must keep giving the same results.
+STRPTIME_FORMATS = ["%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y/%m/%d %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S"]
+
+TIMESTAMPS = [
+    "2023:01:02 03:04:05",
+    "2023-01-02 03:04:05",
+    "2023-01-02T03:04:05",
+    "2023-01-02t03:04:05",
+    "2023/12/31 23:59:59",
+    "2023-1-2  3:4:5",
+    "12/31/2023 10:00:00",
+    "31/12/2023 10:00:00",
+    "05/06/2023 10:00:00",
+    "31/31/2023 00:00:00",
+    "2023:02:30 00:00:00",
+    "2023:13:01 00:00:00",
+    "2023:01:02 24:00:00",
+    "2023:01:02T03:04:05",
+    "2023: 1: 1  1: 1: 1",
+    "2023:01: 2 03:04:05",
+    " 1/02/2023 10:00:00",
+    " 1/ 2/2023 10:00:00",
+    "2023-01- 2T03:04:05",
+    "2023:01:02\u30003:04:05",
+    "\u0662\u0660\u0662\u0663:\u0660\u0661:\u0660\u0662 \u0660\u0663:\u0660\u0664:\u0660\u0665",
+    "2023:01:0\u0662 03:04:05",
+    "2023:01:02 03:04:60",
+    "2023:+1:01 00:00:00",
+    " 2023:01:02 03:04:05",
+    "    :  :     :  :  ",
+    "2023-05-06",
+    "",
+]
+
+def strptime_reference(timestamp):
+    for fmt in STRPTIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(timestamp, fmt)
+        except ValueError:
+            continue
+    return None
+
+@pytest.mark.parametrize("timestamp", TIMESTAMPS)
+def test_parse_timestamp_matches_strptime(timestamp):
+    assert main._parse_timestamp(timestamp) == strptime_reference(timestamp)
+
+@pytest.mark.parametrize("timestamp", TIMESTAMPS)
+def test_parse_timestamp_ignores_parser_order(timestamp):
+    # Parse a value of every layout first so each one has been promoted to the front.
+    for primer in ("2023:01:02 03:04:05", "2023-01-02 03:04:05", "2023-01-02T03:04:05", "2023/01/02 03:04:05", "12/31/2023 10:00:00"):
+        main._parse_timestamp(primer)
+        assert main._parse_timestamp(timestamp) == strptime_reference(timestamp)
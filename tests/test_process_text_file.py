@@ -0,0 +1,107 @@
+import os
+import stat
+
+import pytest
+
+import main
+
+def normalize(path, target_timezone="Asia/Tokyo"):
+    main.process_text_file(str(path), target_timezone, dry_run=False, verbose=False)
+
+def test_iso_layout_is_kept(tmp_path):
+    path = tmp_path / "r.json"
+    path.write_bytes(b'{"created": "2023-01-02T03:04:05", "logged": "2023/01/02 03:04:05", "exif": "2023:01:02 03:04:05"}\n')
+    normalize(path)
+    assert path.read_bytes() == b'{"created": "2023-01-02T12:04:05", "logged": "2023/01/02 12:04:05", "exif": "2023:01:02 12:04:05"}\n'
+
+def test_crlf_line_endings_are_kept(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"first 2023-01-02 03:04:05\r\nsecond 2023-01-02 23:00:00\r\n")
+    normalize(path)
+    assert path.read_bytes() == b"first 2023-01-02 12:04:05\r\nsecond 2023-01-03 08:00:00\r\n"
+
+def test_timestamps_with_explicit_offset_are_unchanged(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"z 2023-01-02T03:04:05Z f 2023-01-02T03:04:05.123Z o 2023-01-02T03:04:05+02:00 n 2023-01-02 03:04:05\n")
+    normalize(path)
+    assert path.read_bytes() == b"z 2023-01-02T03:04:05Z f 2023-01-02T03:04:05.123Z o 2023-01-02T03:04:05+02:00 n 2023-01-02 12:04:05\n"
+
+def test_ambiguous_and_date_only_values_are_unchanged(tmp_path):
+    path = tmp_path / "a.csv"
+    content = b"05/06/2023 10:00:00,2023-05-06,fe80::1234:56:78\n"
+    path.write_bytes(content)
+    normalize(path)
+    assert path.read_bytes() == content
+
+def test_fixed_offset_target(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"at 2023-12-31 22:30:00\n")
+    normalize(path, "Etc/GMT-5")
+    assert path.read_bytes() == b"at 2024-01-01 03:30:00\n"
+
+def test_utc_to_utc_run_does_not_rewrite(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"at 2023-01-02T03:04:05 and 2023:01:02 03:04:05\n")
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+    inode = path.stat().st_ino
+    normalize(path, "UTC")
+    assert path.read_bytes() == b"at 2023-01-02T03:04:05 and 2023:01:02 03:04:05\n"
+    assert path.stat().st_mtime == 1_000_000_000
+    assert path.stat().st_ino == inode
+
+def test_symlink_is_written_through(tmp_path):
+    target = tmp_path / "b.log"
+    target.write_bytes(b"at 2023-01-02 03:04:05\n")
+    link = tmp_path / "link.log"
+    os.symlink(target, link)
+    normalize(link)
+    assert link.is_symlink()
+    assert target.read_bytes() == b"at 2023-01-02 12:04:05\n"
+
+def test_hard_link_is_rewritten_in_place(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"at 2023-01-02 03:04:05\n")
+    other = tmp_path / "b.log"
+    os.link(path, other)
+    normalize(path)
+    assert other.read_bytes() == b"at 2023-01-02 12:04:05\n"
+    assert path.stat().st_ino == other.stat().st_ino
+
+def test_replaced_file_keeps_permissions(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"at 2023-01-02 03:04:05\n")
+    path.chmod(0o640)
+    normalize(path)
+    assert path.read_bytes() == b"at 2023-01-02 12:04:05\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+def test_in_place_fallback(tmp_path, monkeypatch, encoding):
+    # Used for read-only directories; raw bytes are patched span by span, decoded text is streamed back.
+    monkeypatch.setattr(main, "_can_replace", lambda real_path: False)
+    path = tmp_path / "a.log"
+    path.write_bytes("café 2023-01-02 03:04:05 and 2023-01-02 03:04:05\n".encode(encoding))
+    inode = path.stat().st_ino
+    normalize(path)
+    assert path.read_bytes() == "café 2023-01-02 12:04:05 and 2023-01-02 12:04:05\n".encode(encoding)
+    assert path.stat().st_ino == inode
+
+@pytest.mark.skipif(hasattr(os, "geteuid") and os.geteuid() == 0, reason="root bypasses file permissions")
+def test_read_only_file_is_not_replaced(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"at 2023-01-02 03:04:05\n")
+    path.chmod(0o444)
+    normalize(path)
+    assert path.read_bytes() == b"at 2023-01-02 03:04:05\n"
+
+def test_failed_swap_removes_temporary_file(tmp_path, monkeypatch):
+    path = tmp_path / "a.log"
+    path.write_bytes(b"at 2023-01-02 03:04:05\n")
+
+    def failing_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(main.os, "replace", failing_replace)
+    normalize(path)
+    assert os.listdir(tmp_path) == ["a.log"]
+    assert path.read_bytes() == b"at 2023-01-02 03:04:05\n"